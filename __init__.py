@@ -1 +1 @@
-from .lexical import words_by_level
+from .lexical import words_by_level, words, word_to_id, ids_by_level
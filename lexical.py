@@ -1,3 +1,5 @@
+from array import array
+
 
 words_by_level = {
     'A': [
@@ -29,3 +31,44 @@ words_by_level = {
         "universal", "revolution", "predictive", "mathematical", "sociological", "economical", "jurisdiction"
     ]
 }
+
+# Word IDs index into `words`; they follow lexicon order, so they are
+# only valid within the running process and must not be persisted
+ID_TYPECODE = 'H'
+MAX_WORD_ID = 0xFFFF
+
+
+def _intern_lexicon():
+    """Assign each distinct word an ID, returning (words, word_to_id)"""
+    words = []
+    word_to_id = {}
+    for level_words in words_by_level.values():
+        for word in level_words:
+            if word not in word_to_id:
+                word_to_id[word] = len(words)
+                words.append(word)
+    return words, word_to_id
+
+
+words, word_to_id = _intern_lexicon()
+assert len(words) <= MAX_WORD_ID + 1, "lexicon too large for ID_TYPECODE"
+
+ids_by_level = {
+    level: array(ID_TYPECODE, (word_to_id[word] for word in level_words))
+    for level, level_words in words_by_level.items()
+}
+
+
+def split_paragraphs(session_ids, size):
+    """Return offsets so paragraph i spans offsets[i]:offsets[i+1]"""
+    offsets = array('I', range(0, len(session_ids), size))
+    offsets.append(len(session_ids))
+    return offsets
+
+
+def paragraph_text(session_ids, offsets, index):
+    """Return paragraph `index` as display text, or empty if out of range"""
+    if index >= len(offsets) - 1:
+        return ""
+    start, end = offsets[index], offsets[index+1]
+    return " ".join(words[word_id] for word_id in session_ids[start:end])
@@ -0,0 +1,40 @@
+import random
+import unittest
+from array import array
+from lexical import ID_TYPECODE, words, word_to_id, words_by_level, ids_by_level, split_paragraphs, paragraph_text
+
+
+class LexicalTest(unittest.TestCase):
+    def test_ids_round_trip(self):
+        """Every lexicon word maps to an ID that resolves back to it"""
+        for level, level_words in words_by_level.items():
+            self.assertEqual([words[i] for i in ids_by_level[level]], level_words)
+        self.assertEqual(len(words), len(set(words)))
+        self.assertEqual(len(word_to_id), len(words))
+
+    def test_paragraphs_match_list_of_lists(self):
+        """Offsets give the same paragraphs as slicing a list of strings"""
+        rng = random.Random(0)
+        session_ids = array(ID_TYPECODE, rng.choices(range(len(words)), k=200))
+        offsets = split_paragraphs(session_ids, 6)
+
+        old_words = [words[i] for i in session_ids]
+        old_paragraphs = [old_words[i:i+6] for i in range(0, len(old_words), 6)]
+
+        self.assertEqual(len(offsets) - 1, len(old_paragraphs))
+        for index, paragraph in enumerate(old_paragraphs):
+            self.assertEqual(offsets[index+1] - offsets[index], len(paragraph))
+            self.assertEqual(paragraph_text(session_ids, offsets, index), " ".join(paragraph))
+        # 200 words leave a short final paragraph of 2
+        self.assertEqual(offsets[-1] - offsets[-2], 2)
+        self.assertEqual(paragraph_text(session_ids, offsets, len(old_paragraphs)), "")
+
+    def test_empty_session(self):
+        """An empty session has no paragraphs"""
+        offsets = split_paragraphs(array(ID_TYPECODE), 6)
+        self.assertEqual(list(offsets), [0])
+        self.assertEqual(paragraph_text(array(ID_TYPECODE), offsets, 0), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
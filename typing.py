@@ -1,7 +1,8 @@
 import tkinter as tk
 import random
 import time
-from lexical import words_by_level
+from array import array
+from lexical import ID_TYPECODE, words, ids_by_level, split_paragraphs, paragraph_text
 
 class TypingApp:
     def __init__(self, root):
@@ -20,8 +21,8 @@ class TypingApp:
         self.timer_color = "#FFFDF6"  # White for timer
         
         # Initialize variables
-        self.words = []
-        self.paragraphs = []
+        self.session_ids = array(ID_TYPECODE)
+        self.paragraph_offsets = array('I', [0])
         self.leaderboard = []
         
         # Create main canvas with adjusted size
@@ -146,16 +147,16 @@ class TypingApp:
         # Clear the canvas
         self.canvas.delete("all")
         
-        # Prepare word lists
-        all_words = []
+        # Prepare word IDs
+        all_ids = array(ID_TYPECODE)
         for level, weight in {'A': 0.45, 'B': 0.40, 'C': 0.15}.items():
-            level_words = random.choices(words_by_level[level], k=int(200 * weight))  # Reduced word count
-            all_words.extend(level_words)
+            level_ids = random.choices(ids_by_level[level], k=int(200 * weight))  # Reduced word count
+            all_ids.extend(level_ids)
         
-        random.shuffle(all_words)
-        self.words = all_words
+        random.shuffle(all_ids)
+        self.session_ids = all_ids
         # display 6 words per paragraph
-        self.paragraphs = [self.words[i:i+6] for i in range(0, len(self.words), 6)]
+        self.paragraph_offsets = split_paragraphs(self.session_ids, 6)
 
         self.reset_test_vars()
 
@@ -282,9 +283,21 @@ class TypingApp:
         if hasattr(self, 'score_label'):
             self.score_label.place_forget()
 
+    def paragraph_count(self):
+        """Return the number of paragraphs in the current test"""
+        return len(self.paragraph_offsets) - 1
+
+    def paragraph_length(self, index):
+        """Return the number of words in the given paragraph"""
+        return self.paragraph_offsets[index+1] - self.paragraph_offsets[index]
+
+    def paragraph_text(self, index):
+        """Return the paragraph as display text, or empty if out of range"""
+        return paragraph_text(self.session_ids, self.paragraph_offsets, index)
+
     def update_paragraphs(self, animate=False):
         """Update the displayed paragraphs with optional animation"""
-        if self.current_paragraph_index >= len(self.paragraphs):
+        if self.current_paragraph_index >= self.paragraph_count():
             self.end_test()
             return
 
@@ -296,8 +309,8 @@ class TypingApp:
         self.text_display.delete("1.0", tk.END)
         
         # Show current and next paragraph
-        current_p = " ".join(self.paragraphs[self.current_paragraph_index])
-        next_p = " ".join(self.paragraphs[self.current_paragraph_index+1]) if self.current_paragraph_index+1 < len(self.paragraphs) else ""
+        current_p = self.paragraph_text(self.current_paragraph_index)
+        next_p = self.paragraph_text(self.current_paragraph_index+1)
         
         self.text_display.insert(tk.END, current_p + "\n\n" + next_p)  # Added extra newline
         self.text_display.config(state=tk.DISABLED)
@@ -313,9 +326,9 @@ class TypingApp:
         self.animation_direction = 1  # Up direction
         
         # Get the paragraphs to display
-        current_p = " ".join(self.paragraphs[self.current_paragraph_index])
-        next_p = " ".join(self.paragraphs[self.current_paragraph_index+1]) if self.current_paragraph_index+1 < len(self.paragraphs) else ""
-        next_next_p = " ".join(self.paragraphs[self.current_paragraph_index+2]) if self.current_paragraph_index+2 < len(self.paragraphs) else ""
+        current_p = self.paragraph_text(self.current_paragraph_index)
+        next_p = self.paragraph_text(self.current_paragraph_index+1)
+        next_next_p = self.paragraph_text(self.current_paragraph_index+2)
         
         self.text_display.config(state=tk.NORMAL)
         self.text_display.delete("1.0", tk.END)
@@ -349,7 +362,7 @@ class TypingApp:
     def highlight_current_word(self):
         """Highlight the current word that needs to be typed"""
         # just in case user type too fast
-        if self.current_paragraph_index >= len(self.paragraphs):
+        if self.current_paragraph_index >= self.paragraph_count():
             return
             
         self.text_display.config(state=tk.NORMAL)
@@ -376,9 +389,9 @@ class TypingApp:
         if not typed:  # Ignore empty input
             return
 
-        current_word = self.paragraphs[self.current_paragraph_index][self.current_word_index]
+        word_id = self.session_ids[self.paragraph_offsets[self.current_paragraph_index] + self.current_word_index]
 
-        if typed == current_word:
+        if typed == words[word_id]:
             self.correct_count += 1
         else:
             self.incorrect_count += 1
@@ -386,9 +399,9 @@ class TypingApp:
         self.input_entry.delete(0, tk.END)
         self.current_word_index += 1
 
-        if self.current_word_index >= len(self.paragraphs[self.current_paragraph_index]):
+        if self.current_word_index >= self.paragraph_length(self.current_paragraph_index):
             # Start paragraph transition animation
-            if self.current_paragraph_index + 1 < len(self.paragraphs):
+            if self.current_paragraph_index + 1 < self.paragraph_count():
                 self.update_paragraphs(animate=True)
             else:
                 self.end_test()